@@ -2,7 +2,6 @@ import streamlit as st
 import json
 import base64
 from emirates_id_extractor import EmiratesIDExtractor
-import tempfile
 import os
 
 # Set page config
@@ -51,6 +50,15 @@ st.markdown("""
         margin-top: 20px;
     }
     
+    .result-grid {
+        display: flex;
+        gap: 1rem;
+    }
+    
+    .result-column {
+        flex: 1;
+    }
+    
     .field-label {
         color: rgba(255, 255, 255, 0.6);
         font-size: 14px;
@@ -66,6 +74,22 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Result fields as (key, label) pairs, one list per display column
+RESULT_COLUMNS = [
+    [
+        ("name", "Name"),
+        ("uid_no", "UID Number"),
+        ("passport_no", "Passport Number"),
+        ("profession", "Profession"),
+    ],
+    [
+        ("sponsor", "Sponsor"),
+        ("place_of_issue", "Place of Issue"),
+        ("issue_date", "Issue Date"),
+        ("expiry_date", "Expiry Date"),
+    ],
+]
+
 def main():
     st.title("Emirates ID Information Extractor")
     
@@ -97,6 +121,14 @@ def main():
 
     extractor = get_extractor()
 
+    # Cache results by file content so repeat clicks skip Textract and the LLM;
+    # entries expire after a few minutes so extracted ID data is not kept
+    @st.cache_data(show_spinner=False, max_entries=128, ttl=300)
+    def extract(file_bytes: bytes, file_extension: str):
+        return extractor.extract_text_from_image_bytes(
+            file_bytes, BUCKET_NAME, file_extension=file_extension
+        )
+
     # Initialize session state for tracking current file
     if 'current_file_name' not in st.session_state:
         st.session_state.current_file_name = None
@@ -111,25 +143,13 @@ def main():
             st.session_state.current_file_name = current_file_name
             if 'extracted_info' in st.session_state:
                 del st.session_state.extracted_info
-            if 'file_content' in st.session_state:
-                del st.session_state.file_content
-        
-        # Store new file content
-        if 'file_content' not in st.session_state:
-            st.session_state.file_content = uploaded_file.read()
 
         if st.button("Process the Card", type="primary"):
             with st.spinner("Processing Emirates ID..."):
                 try:
-                    # Create temporary file
+                    # Process the uploaded buffer straight from memory
                     file_extension = os.path.splitext(uploaded_file.name)[1]
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-                        tmp_file.write(st.session_state.file_content)
-                        temp_path = tmp_file.name
-
-                    # Process the file
-                    extracted_info = extractor.extract_text_from_image(temp_path, BUCKET_NAME)
-                    os.unlink(temp_path)  # Clean up temporary file
+                    extracted_info = extract(uploaded_file.getvalue(), file_extension)
 
                     # Store results in session state
                     st.session_state.extracted_info = extracted_info
@@ -137,36 +157,17 @@ def main():
                 except Exception as e:
                     st.error(f"Error processing Emirates ID: {str(e)}")
 
-        # Display results if available
+        # Display results if available, rendered in a single markdown write
         if hasattr(st.session_state, 'extracted_info'):
-            # Create columns for layout
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.markdown('<div class="field-label">Name</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="field-value">{st.session_state.extracted_info.get("name", "Not Found")}</div>', unsafe_allow_html=True)
-                
-                st.markdown('<div class="field-label">UID Number</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="field-value">{st.session_state.extracted_info.get("uid_no", "Not Found")}</div>', unsafe_allow_html=True)
-                
-                st.markdown('<div class="field-label">Passport Number</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="field-value">{st.session_state.extracted_info.get("passport_no", "Not Found")}</div>', unsafe_allow_html=True)
-                
-                st.markdown('<div class="field-label">Profession</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="field-value">{st.session_state.extracted_info.get("profession", "Not Found")}</div>', unsafe_allow_html=True)
-
-            with col2:
-                st.markdown('<div class="field-label">Sponsor</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="field-value">{st.session_state.extracted_info.get("sponsor", "Not Found")}</div>', unsafe_allow_html=True)
-                
-                st.markdown('<div class="field-label">Place of Issue</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="field-value">{st.session_state.extracted_info.get("place_of_issue", "Not Found")}</div>', unsafe_allow_html=True)
-                
-                st.markdown('<div class="field-label">Issue Date</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="field-value">{st.session_state.extracted_info.get("issue_date", "Not Found")}</div>', unsafe_allow_html=True)
-                
-                st.markdown('<div class="field-label">Expiry Date</div>', unsafe_allow_html=True)
-                st.markdown(f'<div class="field-value">{st.session_state.extracted_info.get("expiry_date", "Not Found")}</div>', unsafe_allow_html=True)
+            columns_html = "".join(
+                '<div class="result-column">' + "".join(
+                    f'<div class="field-label">{label}</div>'
+                    f'<div class="field-value">{st.session_state.extracted_info.get(field, "Not Found")}</div>'
+                    for field, label in column
+                ) + '</div>'
+                for column in RESULT_COLUMNS
+            )
+            st.markdown(f'<div class="result-grid">{columns_html}</div>', unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,15 +1,158 @@
+import asyncio
 import boto3
+from botocore.config import Config
 import json
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import os
-from IPython.display import display, HTML
+import logging
 import re
+import math
+import time
+import uuid
 from datetime import datetime
-from langchain.llms import OpenAI
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.embeddings.openai import OpenAIEmbeddings
-from langchain.vectorstores import FAISS
-from langchain.chains.question_answering import load_qa_chain
+from openai import AsyncOpenAI, OpenAI
+
+# Prefer orjson for parsing LLM responses; its JSONDecodeError subclasses
+# json.JSONDecodeError, so the regex fallback catches either
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# LangChain, FAISS, NumPy and aioboto3 are imported where they are used so
+# the common single-card path never loads them
+if TYPE_CHECKING:
+    from langchain.vectorstores import FAISS
+
+logger = logging.getLogger(__name__)
+
+# Textract output for a single card fits comfortably in one prompt; only
+# longer inputs (e.g. multi-page PDFs) go through chunking and retrieval.
+MAX_DIRECT_TEXT_LENGTH = 3000
+
+# Synchronous Textract accepts inline document bytes up to 5 MB
+MAX_INLINE_DOCUMENT_BYTES = 5 * 1024 * 1024
+TEXTRACT_POLL_INTERVAL = 1
+TEXTRACT_JOB_TIMEOUT = 120
+
+LLM_MODEL = "gpt-4o-mini"
+
+# Patterns for the regex fallback, compiled once at import time
+_PLACE_RE = re.compile(r'(Dubai|Abu Dhabi|Sharjah|Ajman|Umm Al Quwain|Ras Al Khaimah|Fujairah)', re.IGNORECASE)
+_UID_RE = re.compile(r'\b\d{8,9}\b')
+_PASSPORT_RE = re.compile(r'Z\d{7}')
+_DATE_RE = re.compile(r'\d{4}/\d{2}/\d{2}')
+_NAME_RE = re.compile(r'(?:[A-Z]+\s+){2,}[A-Z]+')
+_SPONSOR_RE = re.compile(r'MACKSOFY.*?SERVICES CO\.')
+
+# Shared by the Textract and S3 clients: adaptive retries back off client-side
+# when Textract throttles (TPS limits), and a larger keep-alive connection pool
+# lets batch extraction run concurrent calls without queueing on connections
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+# Shared pool for batch extraction; Textract and OpenAI calls are I/O bound
+_EXTRACTION_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Deletes uploaded S3 objects off the request path once Textract is done
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Prompt description for each field the LLM can be asked to extract, with
+# extra guidance for profession and sponsor
+FIELD_PROMPTS = {
+    "name": "Name (full name in English)",
+    "uid_no": "UID No. (Emirates ID number)",
+    "passport_no": "Passport No.",
+    "profession": """Profession:
+               - If you see "Partner" or "Partner (Female)" by itself, this is the Profession
+               - Simple job titles should be listed as Profession""",
+    "sponsor": """Sponsor:
+               - If you see company names like "MACKSOFY DATA MANAGEMENT & CYBER SECURITY SERVICES CO.", this is the Sponsor
+               - Company names should always be listed as Sponsor, not Profession""",
+    "place_of_issue": "Place of Issue (should be a city name like Dubai)",
+    "issue_date": "Issue Date (in format YYYY/MM/DD)",
+    "expiry_date": "Expiry Date (in format YYYY/MM/DD)",
+}
+
+# Fields the regex fallback extracts reliably enough to skip the LLM. Name,
+# profession and dates are always asked of the model: the name pattern also
+# matches card headers, 'Partner' matches company names, and the first two
+# dates on a card can include the date of birth
+REGEX_TRUSTED_FIELDS = ("uid_no", "passport_no", "place_of_issue", "sponsor")
+
+def _log_cleanup_failure(future, bucket_name: str, s3_file_path: str) -> None:
+    """Log a failed background S3 delete so uploaded ID documents are not left unnoticed."""
+    error = future.exception()
+    if error is not None:
+        logger.error("Failed to delete s3://%s/%s: %s", bucket_name, s3_file_path, error)
+
+def _missing_fields(extracted_info: Dict[str, str]) -> List[str]:
+    """Return the fields the LLM still has to extract after the regex pass.
+
+    This is never empty, because the untrusted fields are always included.
+    """
+    return [
+        field for field, value in extracted_info.items()
+        if field not in REGEX_TRUSTED_FIELDS or value == "Not Found"
+    ]
+
+def _merge_llm(extracted_info: Dict[str, str], llm_info: Dict[str, str],
+               missing: List[str]) -> Dict[str, str]:
+    """Fill the missing fields of the regex result from the LLM result."""
+    for field in missing:
+        extracted_info[field] = llm_info.get(field, "Not Found")
+    return extracted_info
+
+def _needs_async_textract(image_bytes: bytes) -> bool:
+    """Return whether a document is too large for inline Textract detection."""
+    return len(image_bytes) > MAX_INLINE_DOCUMENT_BYTES
+
+def _build_query(fields: List[str]) -> str:
+    """Build the extraction prompt for the requested fields."""
+    details = "\n".join(
+        f"            {number}. {FIELD_PROMPTS[field]}" for number, field in enumerate(fields, 1)
+    )
+    keys = ",\n".join(f'                "{field}": ""' for field in fields)
+    return f"""Extract the following details from the text. For each field, if the information is not found, write 'Not Found'.
+            
+{details}
+
+            Important:
+            - Any text containing 'SERVICES CO', 'DATA MANAGEMENT' should be listed as Sponsor
+            - Job titles like 'Partner' or 'Partner (Female)' should be listed as Profession
+            
+            Format the response as a JSON object with these exact keys:
+            {{
+{keys}
+            }}
+            
+            Only return the JSON object, nothing else."""
+
+def _chat_request(query: str, context: str) -> dict:
+    """Build the JSON-mode chat completion arguments for an extraction query."""
+    return {
+        "model": LLM_MODEL,
+        "temperature": 0,
+        "response_format": {"type": "json_object"},
+        "messages": [
+            {"role": "system", "content": query},
+            {"role": "user", "content": context}
+        ]
+    }
+
+def _fast_split(text: str, size: int = 512, overlap: int = 32) -> List[str]:
+    """Split text into fixed-size overlapping chunks."""
+    step = size - overlap
+    return [text[i:i + size] for i in range(0, max(len(text), 1), step)]
+
+def _line_texts(blocks: list) -> List[str]:
+    """Return the text of the LINE blocks in a Textract response."""
+    return [block['Text'] for block in blocks if block.get('BlockType') == 'LINE']
 
 class EmiratesIDExtractor:
     def __init__(self, region_name: str, aws_access_key_id: str, aws_secret_access_key: str, openai_api_key: str):
@@ -18,27 +161,40 @@ class EmiratesIDExtractor:
             "textract",
             region_name=region_name,
             aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key
+            aws_secret_access_key=aws_secret_access_key,
+            config=AWS_CLIENT_CONFIG
         )
 
         self.s3_client = boto3.client(
             "s3",
             region_name=region_name,
             aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key
+            aws_secret_access_key=aws_secret_access_key,
+            config=AWS_CLIENT_CONFIG
         )
 
+        # Kept for the async clients, which are opened per call since they are
+        # bound to the event loop that runs them
+        self.aws_credentials = {
+            "region_name": region_name,
+            "aws_access_key_id": aws_access_key_id,
+            "aws_secret_access_key": aws_secret_access_key
+        }
+
         # Set OpenAI API key
         os.environ["OPENAI_API_KEY"] = openai_api_key
+        self.openai_api_key = openai_api_key
 
-        # Initialize LangChain components
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=512,
-            chunk_overlap=32,
-            length_function=len,
-        )
-        self.embeddings = OpenAIEmbeddings()
-        self.llm = OpenAI(temperature=0)
+        self.openai_client = OpenAI(api_key=openai_api_key)
+        self._embeddings = None
+
+    @property
+    def embeddings(self):
+        """LangChain OpenAI embeddings, created on first use (texts longer than MAX_DIRECT_TEXT_LENGTH)."""
+        if self._embeddings is None:
+            from langchain.embeddings.openai import OpenAIEmbeddings
+            self._embeddings = OpenAIEmbeddings()
+        return self._embeddings
 
     def upload_to_s3(self, local_file_path: str, bucket_name: str, s3_file_path: str) -> str:
         """Upload the image to S3 bucket."""
@@ -48,80 +204,109 @@ class EmiratesIDExtractor:
         except Exception as e:
             raise Exception(f"Error uploading to S3: {str(e)}")
 
-    def process_and_query(self, text: str) -> Dict[str, str]:
-        """Process extracted text using LangChain and OpenAI."""
+    def upload_bytes_to_s3(self, file_bytes: bytes, bucket_name: str, s3_file_path: str) -> str:
+        """Upload in-memory image bytes to S3 bucket."""
         try:
-            # Split text into chunks
-            texts = self.text_splitter.split_text(text)
-            
-            # Create vector store
-            docsearch = FAISS.from_texts(texts, self.embeddings)
-            
-            # Create QA chain
-            chain = load_qa_chain(self.llm, chain_type="stuff")
-            
-            # Modified prompt with better guidance for profession and sponsor
-            query = """Extract the following details from the text. For each field, if the information is not found, write 'Not Found'.
-            
-            1. Name (full name in English)
-            2. UID No. (Emirates ID number)
-            3. Passport No.
-            4. Profession:
-               - If you see "Partner" or "Partner (Female)" by itself, this is the Profession
-               - Simple job titles should be listed as Profession
-            5. Sponsor:
-               - If you see company names like "MACKSOFY DATA MANAGEMENT & CYBER SECURITY SERVICES CO.", this is the Sponsor
-               - Company names should always be listed as Sponsor, not Profession
-            6. Place of Issue (should be a city name like Dubai)
-            7. Issue Date (in format YYYY/MM/DD)
-            8. Expiry Date (in format YYYY/MM/DD)
+            self.s3_client.put_object(Bucket=bucket_name, Key=s3_file_path, Body=file_bytes)
+            return f"s3://{bucket_name}/{s3_file_path}"
+        except Exception as e:
+            raise Exception(f"Error uploading to S3: {str(e)}")
 
-            Important:
-            - Any text containing 'SERVICES CO', 'DATA MANAGEMENT' should be listed as Sponsor
-            - Job titles like 'Partner' or 'Partner (Female)' should be listed as Profession
-            
-            Format the response as a JSON object with these exact keys:
-            {
-                "name": "",
-                "uid_no": "",
-                "passport_no": "",
-                "profession": "",
-                "sponsor": "",
-                "place_of_issue": "",
-                "issue_date": "",
-                "expiry_date": ""
-            }
-            
-            Only return the JSON object, nothing else."""
-            
-            # Get relevant documents
-            docs = docsearch.similarity_search(query)
-            
-            # Run the query
-            result = chain.run(input_documents=docs, question=query)
+    def build_vector_store(self, texts: list) -> "FAISS":
+        """Build an IVF-partitioned FAISS store so queries only scan a few cells."""
+        import faiss
+        import numpy as np
+        from langchain.docstore.document import Document
+        from langchain.docstore.in_memory import InMemoryDocstore
+        from langchain.vectorstores import FAISS
+
+        vectors = np.ascontiguousarray(self.embeddings.embed_documents(texts), dtype=np.float32)
+        dimension = vectors.shape[1]
+
+        # Vectors are stored as float16 inside each cell; FAISS quantizes on add
+        nlist = max(1, int(math.sqrt(len(texts))))
+        quantizer = faiss.IndexFlatL2(dimension)
+        index = faiss.IndexIVFScalarQuantizer(
+            quantizer, dimension, nlist, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_L2
+        )
+        index.train(vectors)
+        index.add(vectors)
+        index.nprobe = min(4, nlist)
+
+        docstore = InMemoryDocstore({
+            str(i): Document(page_content=chunk) for i, chunk in enumerate(texts)
+        })
+        return FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id={i: str(i) for i in range(len(texts))}
+        )
+
+    def select_context(self, text: str, query: str) -> str:
+        """Return the text to send to the LLM, retrieving relevant chunks for long inputs."""
+        if len(text) <= MAX_DIRECT_TEXT_LENGTH:
+            return text
+
+        texts = _fast_split(text)
+        docsearch = self.build_vector_store(texts)
+        docs = docsearch.similarity_search(query)
+        return "\n\n".join(doc.page_content for doc in docs)
+
+    def parse_llm_result(self, result: str) -> Dict[str, str]:
+        """Parse the LLM JSON response, falling back to regex extraction."""
+        try:
+            extracted_info = _json_loads(result)
             
-            # Parse the result into a dictionary
-            try:
-                extracted_info = json.loads(result)
+            # Add post-processing for profession/sponsor
+            if 'profession' in extracted_info and 'sponsor' in extracted_info:
+                prof_value = extracted_info['profession']
+                sponsor_value = extracted_info['sponsor']
+                prof_folded = prof_value.casefold()
+                sponsor_folded = sponsor_value.casefold()
                 
-                # Add post-processing for profession/sponsor
-                if 'profession' in extracted_info and 'sponsor' in extracted_info:
-                    prof_value = extracted_info['profession'].upper()
-                    sponsor_value = extracted_info['sponsor'].upper()
-                    
-                    # Check if fields need to be swapped
-                    if 'SERVICES CO' in prof_value or 'DATA MANAGEMENT' in prof_value:
-                        # Swap the fields
-                        extracted_info['profession'], extracted_info['sponsor'] = sponsor_value, prof_value
+                # Swap once if a company name landed in profession or a job
+                # title in sponsor, keeping the original casing
+                if ('services co' in prof_folded or 'data management' in prof_folded
+                        or sponsor_folded.strip() in ('partner', 'partner (female)')):
+                    extracted_info['profession'], extracted_info['sponsor'] = sponsor_value, prof_value
                     
-                    # If sponsor contains just partner, swap it
-                    if sponsor_value.strip() in ['PARTNER', 'PARTNER (FEMALE)']:
-                        extracted_info['profession'], extracted_info['sponsor'] = sponsor_value, prof_value
-                        
-            except json.JSONDecodeError:
-                extracted_info = self.extract_using_regex(result)
+        except json.JSONDecodeError:
+            extracted_info = self.extract_using_regex(result)
+        
+        return extracted_info
+
+    def build_llm_request(self, text: str, fields: Optional[List[str]] = None) -> dict:
+        """Build the chat completion arguments for the given fields, retrieving context for long texts."""
+        query = _build_query(fields or list(FIELD_PROMPTS))
+        return _chat_request(query, self.select_context(text, query))
+
+    def process_and_query(self, text: str, fields: Optional[List[str]] = None) -> Dict[str, str]:
+        """Process extracted text with a single JSON-mode OpenAI chat completion.
+
+        Only the given fields are requested from the model; all fields are
+        requested when none are given.
+        """
+        try:
+            response = self.openai_client.chat.completions.create(**self.build_llm_request(text, fields))
+            return self.parse_llm_result(response.choices[0].message.content)
             
-            return extracted_info
+        except Exception as e:
+            raise Exception(f"Error in LLM processing: {str(e)}")
+
+    async def process_and_query_async(self, openai_client: AsyncOpenAI, text: str,
+                                      fields: Optional[List[str]] = None) -> Dict[str, str]:
+        """Async variant of process_and_query using the given AsyncOpenAI client."""
+        try:
+            # Retrieval for long texts uses the sync embeddings client, so only
+            # those need a worker thread
+            if len(text) <= MAX_DIRECT_TEXT_LENGTH:
+                request = self.build_llm_request(text, fields)
+            else:
+                request = await asyncio.to_thread(self.build_llm_request, text, fields)
+
+            response = await openai_client.chat.completions.create(**request)
+            return self.parse_llm_result(response.choices[0].message.content)
             
         except Exception as e:
             raise Exception(f"Error in LLM processing: {str(e)}")
@@ -141,29 +326,28 @@ class EmiratesIDExtractor:
         
         # Extract information using regex patterns
         # Place of Issue pattern
-        place_match = re.search(r'(Dubai|Abu Dhabi|Sharjah|Ajman|Umm Al Quwain|Ras Al Khaimah|Fujairah)',
-                              text, re.IGNORECASE)
+        place_match = _PLACE_RE.search(text)
         if place_match:
             extracted_info["place_of_issue"] = place_match.group(1)
         
         # UID pattern (numbers only)
-        uid_match = re.search(r'\b\d{8,9}\b', text)
+        uid_match = _UID_RE.search(text)
         if uid_match:
             extracted_info["uid_no"] = uid_match.group(0)
         
         # Passport pattern (Z followed by numbers)
-        passport_match = re.search(r'Z\d{7}', text)
+        passport_match = _PASSPORT_RE.search(text)
         if passport_match:
             extracted_info["passport_no"] = passport_match.group(0)
         
         # Date pattern
-        date_matches = re.findall(r'\d{4}/\d{2}/\d{2}', text)
+        date_matches = _DATE_RE.findall(text)
         if len(date_matches) >= 2:
             extracted_info["issue_date"] = date_matches[0]
             extracted_info["expiry_date"] = date_matches[1]
         
         # Name pattern (all caps words)
-        name_match = re.search(r'([A-Z]+\s+){2,}[A-Z]+', text)
+        name_match = _NAME_RE.search(text)
         if name_match:
             extracted_info["name"] = name_match.group(0)
             
@@ -172,22 +356,20 @@ class EmiratesIDExtractor:
             extracted_info["profession"] = "Partner"
             
         # Sponsor pattern (company name)
-        sponsor_match = re.search(r'MACKSOFY.*SERVICES CO\.', text)
+        sponsor_match = _SPONSOR_RE.search(text)
         if sponsor_match:
             extracted_info["sponsor"] = sponsor_match.group(0)
         
         return extracted_info
 
-    def extract_text_from_image(self, image_path: str, bucket_name: str) -> Dict[str, str]:
-        """Extract text from Emirates ID image using Amazon Textract and process with LLM."""
-        try:
-            # Upload image to S3
-            s3_file_path = f"emirates_ids/{os.path.basename(image_path)}"
-            s3_uri = self.upload_to_s3(image_path, bucket_name, s3_file_path)
+    def detect_text_via_s3(self, file_bytes: bytes, bucket_name: str, file_extension: str) -> List[str]:
+        """Run asynchronous Textract detection for documents the sync API cannot take inline."""
+        s3_file_path = f"emirates_ids/{uuid.uuid4().hex}{file_extension}"
+        self.upload_bytes_to_s3(file_bytes, bucket_name, s3_file_path)
 
-            # Get the object from S3
-            response = self.textract_client.detect_document_text(
-                Document={
+        try:
+            job = self.textract_client.start_document_text_detection(
+                DocumentLocation={
                     'S3Object': {
                         'Bucket': bucket_name,
                         'Name': s3_file_path
@@ -195,58 +377,145 @@ class EmiratesIDExtractor:
                 }
             )
 
-            # Extract text from all blocks
-            extracted_text = " ".join([
-                block['Text'] for block in response['Blocks']
-                if block['BlockType'] == 'LINE'
-            ])
+            # Poll until the job finishes, then keep only the LINE text of each
+            # result page as it arrives rather than buffering every block
+            lines = []
+            request = {'JobId': job['JobId']}
+            deadline = time.monotonic() + TEXTRACT_JOB_TIMEOUT
+            while True:
+                response = self.textract_client.get_document_text_detection(**request)
+                status = response['JobStatus']
+                if status == 'IN_PROGRESS':
+                    if time.monotonic() > deadline:
+                        raise Exception(f"Textract job did not finish within {TEXTRACT_JOB_TIMEOUT} seconds")
+                    time.sleep(TEXTRACT_POLL_INTERVAL)
+                    continue
+                if status == 'FAILED':
+                    raise Exception(response.get('StatusMessage', 'Textract job failed'))
+
+                lines.extend(_line_texts(response['Blocks']))
+                if 'NextToken' not in response:
+                    return lines
+                request['NextToken'] = response['NextToken']
 
-            # Process text with LLM
-            extracted_info = self.process_and_query(extracted_text)
+        finally:
+            # Clean up S3 in the background; the result does not depend on it
+            cleanup = _CLEANUP_POOL.submit(self.s3_client.delete_object, Bucket=bucket_name, Key=s3_file_path)
+            cleanup.add_done_callback(
+                lambda future: _log_cleanup_failure(future, bucket_name, s3_file_path)
+            )
 
-            # Clean up S3
-            self.s3_client.delete_object(Bucket=bucket_name, Key=s3_file_path)
+    def detect_text(self, image_bytes: bytes, bucket_name: str, file_extension: str = ".jpg") -> str:
+        """Run Amazon Textract on image bytes and return the detected lines as one string."""
+        # Documents up to 5 MB go to Textract inline; larger files and
+        # multi-page PDFs (rejected inline) need the S3-backed asynchronous API
+        if _needs_async_textract(image_bytes):
+            lines = self.detect_text_via_s3(image_bytes, bucket_name, file_extension)
+        else:
+            try:
+                response = self.textract_client.detect_document_text(
+                    Document={'Bytes': image_bytes}
+                )
+                lines = _line_texts(response['Blocks'])
+            except self.textract_client.exceptions.UnsupportedDocumentException:
+                lines = self.detect_text_via_s3(image_bytes, bucket_name, file_extension)
 
-            return extracted_info
+        return " ".join(lines)
+
+    def extract_fields(self, text: str) -> Dict[str, str]:
+        """Extract trusted card fields with regex, asking the LLM only for the rest."""
+        extracted_info = self.extract_using_regex(text)
+        missing = _missing_fields(extracted_info)
+        # Process text with LLM; the prompt covers only the fields regex could not settle
+        llm_info = self.process_and_query(text, fields=missing)
+        return _merge_llm(extracted_info, llm_info, missing)
+
+    def extract_text_from_image_bytes(self, image_bytes: bytes, bucket_name: str,
+                                      file_extension: str = ".jpg") -> Dict[str, str]:
+        """Extract text from Emirates ID image bytes using Amazon Textract and process with LLM."""
+        try:
+            extracted_text = self.detect_text(image_bytes, bucket_name, file_extension)
+            return self.extract_fields(extracted_text)
 
         except Exception as e:
             raise Exception(f"Error processing Emirates ID: {str(e)}")
 
-def display_results(extracted_info):
-    """Display results in a formatted HTML table"""
-    html = """
-    <div style="background-color: #f5f5f5; padding: 20px; border-radius: 10px; margin: 20px 0;">
-        <h3 style="color: #2c3e50; margin-bottom: 15px;">Extracted Information</h3>
-        <table style="width: 100%; border-collapse: collapse;">
-    """
+    def extract_text_from_images_batch(self, images: List[Tuple[bytes, str]],
+                                       bucket_name: str) -> List[Dict[str, str]]:
+        """Extract information from several Emirates ID images concurrently.
 
-    # Define field order and labels
-    fields = [
-        ('name', 'Name'),
-        ('uid_no', 'UID Number'),
-        ('passport_no', 'Passport Number'),
-        ('profession', 'Profession'),
-        ('sponsor', 'Sponsor'),
-        ('place_of_issue', 'Place of Issue'),
-        ('issue_date', 'Issue Date'),
-        ('expiry_date', 'Expiry Date')
-    ]
+        Each image is given as an (image bytes, file extension) pair.
+        """
+        try:
+            # Submit every Textract call up front, then run the LLM step on the results
+            texts = list(_EXTRACTION_POOL.map(
+                lambda image: self.detect_text(image[0], bucket_name, image[1]),
+                images
+            ))
+            return list(_EXTRACTION_POOL.map(self.extract_fields, texts))
 
-    for field, label in fields:
-        value = extracted_info.get(field, 'Not Found')
-        color = "#c0392b" if value == "Not Found" else "#2c3e50"
-        html += f"""
-            <tr style="border-bottom: 1px solid #ddd;">
-                <td style="padding: 10px; font-weight: bold; color: #34495e; width: 30%;">{label}</td>
-                <td style="padding: 10px; color: {color};">{value}</td>
-            </tr>
+        except Exception as e:
+            raise Exception(f"Error processing Emirates ID batch: {str(e)}")
+
+    async def detect_text_async(self, textract_client, image_bytes: bytes, bucket_name: str,
+                                file_extension: str = ".jpg") -> str:
+        """Async variant of detect_text using the given aioboto3 Textract client."""
+        if _needs_async_textract(image_bytes):
+            lines = await asyncio.to_thread(self.detect_text_via_s3, image_bytes, bucket_name, file_extension)
+        else:
+            try:
+                response = await textract_client.detect_document_text(
+                    Document={'Bytes': image_bytes}
+                )
+                lines = _line_texts(response['Blocks'])
+            except textract_client.exceptions.UnsupportedDocumentException:
+                lines = await asyncio.to_thread(self.detect_text_via_s3, image_bytes, bucket_name, file_extension)
+
+        return " ".join(lines)
+
+    async def extract_fields_async(self, openai_client: AsyncOpenAI, text: str) -> Dict[str, str]:
+        """Async variant of extract_fields."""
+        extracted_info = self.extract_using_regex(text)
+        missing = _missing_fields(extracted_info)
+        llm_info = await self.process_and_query_async(openai_client, text, fields=missing)
+        return _merge_llm(extracted_info, llm_info, missing)
+
+    async def extract_text_from_images_async(self, images: List[Tuple[bytes, str]],
+                                             bucket_name: str) -> List[Dict[str, str]]:
+        """Extract information from several Emirates ID images with overlapping async I/O.
+
+        Each image is given as an (image bytes, file extension) pair.
         """
+        async def extract_one(textract_client, openai_client, image_bytes, file_extension):
+            text = await self.detect_text_async(textract_client, image_bytes, bucket_name, file_extension)
+            return await self.extract_fields_async(openai_client, text)
 
-    html += """
-        </table>
-    </div>
-    """
-    display(HTML(html))
+        import aioboto3
+
+        try:
+            async with aioboto3.Session(**self.aws_credentials).client("textract", config=AWS_CLIENT_CONFIG) as textract_client, \
+                    AsyncOpenAI(api_key=self.openai_api_key) as openai_client:
+                return list(await asyncio.gather(*(
+                    extract_one(textract_client, openai_client, image_bytes, file_extension)
+                    for image_bytes, file_extension in images
+                )))
+
+        except Exception as e:
+            raise Exception(f"Error processing Emirates ID batch: {str(e)}")
+
+    async def extract_text_from_image_async(self, image_bytes: bytes, bucket_name: str,
+                                            file_extension: str = ".jpg") -> Dict[str, str]:
+        """Async variant of extract_text_from_image_bytes."""
+        results = await self.extract_text_from_images_async([(image_bytes, file_extension)], bucket_name)
+        return results[0]
+
+    def extract_text_from_image(self, image_path: str, bucket_name: str) -> Dict[str, str]:
+        """Extract text from an Emirates ID image file on disk."""
+        with open(image_path, "rb") as image_file:
+            image_bytes = image_file.read()
+        return self.extract_text_from_image_bytes(
+            image_bytes, bucket_name, file_extension=os.path.splitext(image_path)[1]
+        )
 
 # The main() function has been removed since it's not needed in the module file
 # All credential handling is now done in the Streamlit app
\ No newline at end of file
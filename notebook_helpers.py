@@ -0,0 +1,39 @@
+"""Helpers for using the extractor from a Jupyter notebook."""
+
+def display_results(extracted_info):
+    """Display results in a formatted HTML table"""
+    from IPython.display import display, HTML
+
+    html = """
+    <div style="background-color: #f5f5f5; padding: 20px; border-radius: 10px; margin: 20px 0;">
+        <h3 style="color: #2c3e50; margin-bottom: 15px;">Extracted Information</h3>
+        <table style="width: 100%; border-collapse: collapse;">
+    """
+
+    # Define field order and labels
+    fields = [
+        ('name', 'Name'),
+        ('uid_no', 'UID Number'),
+        ('passport_no', 'Passport Number'),
+        ('profession', 'Profession'),
+        ('sponsor', 'Sponsor'),
+        ('place_of_issue', 'Place of Issue'),
+        ('issue_date', 'Issue Date'),
+        ('expiry_date', 'Expiry Date')
+    ]
+
+    for field, label in fields:
+        value = extracted_info.get(field, 'Not Found')
+        color = "#c0392b" if value == "Not Found" else "#2c3e50"
+        html += f"""
+            <tr style="border-bottom: 1px solid #ddd;">
+                <td style="padding: 10px; font-weight: bold; color: #34495e; width: 30%;">{label}</td>
+                <td style="padding: 10px; color: {color};">{value}</td>
+            </tr>
+        """
+
+    html += """
+        </table>
+    </div>
+    """
+    display(HTML(html))